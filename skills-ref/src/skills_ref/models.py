@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillProperties:
     """Properties parsed from a skill's SKILL.md frontmatter.
 
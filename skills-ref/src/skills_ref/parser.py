@@ -27,6 +27,27 @@ def find_skill_md(skill_dir: Path) -> Optional[Path]:
     return None
 
 
+def read_frontmatter(skill_md: Path) -> str:
+    """Read the frontmatter portion of a SKILL.md file.
+
+    Only the bytes up to the closing --- are decoded. The markdown body
+    is not needed for reading properties or validating a skill.
+
+    Args:
+        skill_md: Path to the SKILL.md file
+
+    Returns:
+        File content up to and including the closing ---, or the whole
+        file if it has no closed frontmatter block
+    """
+    raw = skill_md.read_bytes()
+    if raw.startswith(b"---"):
+        end = raw.find(b"---", 3)
+        if end != -1:
+            raw = raw[: end + 3]
+    return raw.decode("utf-8")
+
+
 def parse_frontmatter(content: str) -> tuple[dict, str]:
     """Parse YAML frontmatter from SKILL.md content.
 
@@ -86,7 +107,7 @@ def read_properties(skill_dir: Path) -> SkillProperties:
     if skill_md is None:
         raise ParseError(f"SKILL.md not found in {skill_dir}")
 
-    content = skill_md.read_text()
+    content = read_frontmatter(skill_md)
     metadata, _ = parse_frontmatter(content)
 
     if "name" not in metadata:
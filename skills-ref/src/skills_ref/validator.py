@@ -1,25 +1,46 @@
 """Skill validation logic."""
 
+import functools
+import re
 import unicodedata
 from pathlib import Path
 from typing import Optional
 
 from .errors import ParseError
-from .parser import find_skill_md, parse_frontmatter
+from .parser import find_skill_md, parse_frontmatter, read_frontmatter
 
 MAX_SKILL_NAME_LENGTH = 64
 MAX_DESCRIPTION_LENGTH = 1024
 MAX_COMPATIBILITY_LENGTH = 500
 
+# Runs of Unicode letters/digits separated by single hyphens
+_NAME_PATTERN = re.compile(r"[^\W_]+(?:-[^\W_]+)*")
+
 # Allowed frontmatter fields per Agent Skills Spec
-ALLOWED_FIELDS = {
-    "name",
-    "description",
-    "license",
-    "allowed-tools",
-    "metadata",
-    "compatibility",
-}
+ALLOWED_FIELDS = frozenset(
+    {
+        "name",
+        "description",
+        "license",
+        "allowed-tools",
+        "metadata",
+        "compatibility",
+    }
+)
+_ALLOWED_FIELDS_SORTED = str(sorted(ALLOWED_FIELDS))
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """Return the NFKC form of a skill or directory name.
+
+    ASCII strings and strings already in NFKC are returned unchanged,
+    skipping the full normalization pass for the common case. Results are
+    cached since the same names are normalized on every revalidation.
+    """
+    if name.isascii() or unicodedata.is_normalized("NFKC", name):
+        return name
+    return unicodedata.normalize("NFKC", name)
 
 
 def _validate_name(name: str, skill_dir: Path) -> list[str]:
@@ -34,7 +55,7 @@ def _validate_name(name: str, skill_dir: Path) -> list[str]:
         errors.append("Field 'name' must be a non-empty string")
         return errors
 
-    name = unicodedata.normalize("NFKC", name.strip())
+    name = _normalize_name(name.strip())
 
     if len(name) > MAX_SKILL_NAME_LENGTH:
         errors.append(
@@ -45,20 +66,21 @@ def _validate_name(name: str, skill_dir: Path) -> list[str]:
     if name != name.lower():
         errors.append(f"Skill name '{name}' must be lowercase")
 
-    if name.startswith("-") or name.endswith("-"):
-        errors.append("Skill name cannot start or end with a hyphen")
+    if not _NAME_PATTERN.fullmatch(name):
+        if name.startswith("-") or name.endswith("-"):
+            errors.append("Skill name cannot start or end with a hyphen")
 
-    if "--" in name:
-        errors.append("Skill name cannot contain consecutive hyphens")
+        if "--" in name:
+            errors.append("Skill name cannot contain consecutive hyphens")
 
-    if not all(c.isalnum() or c == "-" for c in name):
-        errors.append(
-            f"Skill name '{name}' contains invalid characters. "
-            "Only letters, digits, and hyphens are allowed."
-        )
+        if not all(c.isalnum() or c == "-" for c in name):
+            errors.append(
+                f"Skill name '{name}' contains invalid characters. "
+                "Only letters, digits, and hyphens are allowed."
+            )
 
     if skill_dir:
-        dir_name = unicodedata.normalize("NFKC", skill_dir.name)
+        dir_name = _normalize_name(skill_dir.name)
         if dir_name != name:
             errors.append(
                 f"Directory name '{skill_dir.name}' must match skill name '{name}'"
@@ -105,11 +127,11 @@ def _validate_metadata_fields(metadata: dict) -> list[str]:
     """Validate that only allowed fields are present."""
     errors = []
 
-    extra_fields = set(metadata.keys()) - ALLOWED_FIELDS
+    extra_fields = metadata.keys() - ALLOWED_FIELDS
     if extra_fields:
         errors.append(
             f"Unexpected fields in frontmatter: {', '.join(sorted(extra_fields))}. "
-            f"Only {sorted(ALLOWED_FIELDS)} are allowed."
+            f"Only {_ALLOWED_FIELDS_SORTED} are allowed."
         )
 
     return errors
@@ -169,7 +191,7 @@ def validate(skill_dir: Path) -> list[str]:
         return ["Missing required file: SKILL.md"]
 
     try:
-        content = skill_md.read_text()
+        content = read_frontmatter(skill_md)
         metadata, _ = parse_frontmatter(content)
     except ParseError as e:
         return [str(e)]
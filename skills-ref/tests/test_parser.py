@@ -7,6 +7,7 @@ from skills_ref.parser import (
     ValidationError,
     find_skill_md,
     parse_frontmatter,
+    read_frontmatter,
     read_properties,
 )
 
@@ -186,3 +187,31 @@ Body
     # Verify to_dict outputs as "allowed-tools" (hyphenated)
     d = props.to_dict()
     assert d["allowed-tools"] == "Bash(jq:*) Bash(git:*)"
+
+
+def test_read_frontmatter_stops_at_closing_delimiter(tmp_path):
+    """read_frontmatter should not return the markdown body."""
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_text("""---
+name: my-skill
+description: A test skill
+---
+# My Skill
+
+Body text.
+""")
+    content = read_frontmatter(skill_md)
+    assert content == "---\nname: my-skill\ndescription: A test skill\n---"
+    metadata, body = parse_frontmatter(content)
+    assert metadata["name"] == "my-skill"
+    assert body == ""
+
+
+def test_read_frontmatter_unclosed_returns_whole_file(tmp_path):
+    """Unclosed frontmatter is returned as-is so parsing reports the error."""
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_text("---\nname: my-skill\n")
+    content = read_frontmatter(skill_md)
+    assert content == "---\nname: my-skill\n"
+    with pytest.raises(ParseError, match="not properly closed"):
+        parse_frontmatter(content)
@@ -78,6 +78,20 @@ Body
     assert any("cannot start or end with a hyphen" in e for e in errors)
 
 
+def test_name_trailing_hyphen(tmp_path):
+    skill_dir = tmp_path / "my-skill-"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text("""---
+name: my-skill-
+description: A test skill
+---
+Body
+""")
+    errors = validate(skill_dir)
+    assert any("cannot start or end with a hyphen" in e for e in errors)
+    assert not any("invalid characters" in e for e in errors)
+
+
 def test_name_consecutive_hyphens(tmp_path):
     skill_dir = tmp_path / "my--skill"
     skill_dir.mkdir()